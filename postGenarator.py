@@ -1,19 +1,60 @@
 import csv
+import hashlib
+import itertools
 import json
+import multiprocessing
+import os
 import queue
 import re
+import tempfile
+import sys
 import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+from urllib.parse import urlparse
 
 import requests
-from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageTk
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PIL import Image, ImageDraw, ImageFont, ImageTk, UnidentifiedImageError
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SLUG_TABLE = bytes(code if chr(code).isascii() and chr(code).isalnum() else ord("-") for code in range(256))
+_DRIVE_ID_RES = [
+	re.compile(r"id=([a-zA-Z0-9_-]{10,})"),
+	re.compile(r"/d/([a-zA-Z0-9_-]{10,})"),
+	re.compile(r"file/d/([a-zA-Z0-9_-]{10,})"),
+]
+
+
+def _slug(value: str) -> str:
+	raw = value.strip().encode("ascii", "replace").translate(_SLUG_TABLE).decode("ascii")
+	value = "-".join(part for part in raw.split("-") if part)
+	return value.lower()[:60] if value else "item"
+
+
+def _load_json(path: Path) -> Dict[str, object]:
+	"""Decode a JSON file, with orjson when it is installed."""
+	if orjson is not None:
+		return orjson.loads(Path(path).read_bytes())
+	with open(path, "r", encoding="utf-8") as handle:
+		return json.load(handle)
+
 
 def _resource_path(value: str) -> str:
 	"""Return absolute path for user supplied values."""
@@ -29,7 +70,7 @@ class Orientation(Enum):
 		return cls.LANDSCAPE if width >= height else cls.PORTRAIT
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PhotoAnalysis:
 	width: int
 	height: int
@@ -37,7 +78,7 @@ class PhotoAnalysis:
 	aspect_ratio: float
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Rectangle:
 	x: int
 	y: int
@@ -55,7 +96,7 @@ class Rectangle:
 		return cls(x=int(data["x"]), y=int(data["y"]), width=int(data["width"]), height=int(data["height"]))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TextStyle:
 	font_path: str = ""
 	font_size: int = 42
@@ -83,7 +124,7 @@ class TextStyle:
 		)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TextField:
 	rect: Rectangle
 	style: TextStyle
@@ -111,7 +152,7 @@ class TextField:
 		)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TemplateLayout:
 	orientation: Orientation
 	template_path: str
@@ -121,6 +162,39 @@ class TemplateLayout:
 	description: TextField
 	badge: Optional[TextField] = None
 	badge_format: str = "{0:02d}"
+	_prepared: Dict[str, Tuple[Tuple[object, ...], Tuple[ImageFont.ImageFont, int, int]]] = field(
+		default_factory=dict, init=False, repr=False, compare=False
+	)
+
+	def __getstate__(self) -> Dict[str, object]:
+		# Prepared metrics hold FreeType handles; every process prepares its own.
+		return {item.name: getattr(self, item.name) for item in fields(self) if item.init}
+
+	def __setstate__(self, state: Dict[str, object]) -> None:
+		for name, value in state.items():
+			object.__setattr__(self, name, value)
+		object.__setattr__(self, "_prepared", {})
+
+	def text_fields(self) -> Dict[str, TextField]:
+		text_fields = {"clicked_by": self.clicked_by, "title": self.title, "description": self.description}
+		if self.badge:
+			text_fields["badge"] = self.badge
+		return text_fields
+
+	def prepare(self, font_provider: "FontProvider") -> Dict[str, Tuple[ImageFont.ImageFont, int, int]]:
+		"""Return (font, line height, max lines) per text field."""
+		metrics: Dict[str, Tuple[ImageFont.ImageFont, int, int]] = {}
+		for name, text_field in self.text_fields().items():
+			style = text_field.style
+			key = (style.font_path, style.font_size, style.line_spacing, text_field.rect.height)
+			cached = self._prepared.get(name)
+			if not cached or cached[0] != key:
+				font = font_provider.get(style)
+				line_height = max(FontProvider.line_height(font) + style.line_spacing, 1)
+				cached = (key, (font, line_height, text_field.rect.height // line_height + 1))
+				self._prepared[name] = cached
+			metrics[name] = cached[1]
+		return metrics
 
 	def to_dict(self) -> Dict[str, object]:
 		return {
@@ -167,12 +241,11 @@ class TemplateLayout:
 	def ensure_template_exists(self) -> None:
 		if not self.template_path:
 			raise ValueError("Template path is not set")
-		template_path = Path(self.template_path)
-		if not template_path.exists():
-			raise FileNotFoundError(f"Template not found: {template_path}")
+		if not os.path.exists(self.template_path):
+			raise FileNotFoundError(f"Template not found: {self.template_path}")
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParticipantPhoto:
 	sequence: int
 	submission_index: int
@@ -185,10 +258,6 @@ class ParticipantPhoto:
 	analysis: Optional[PhotoAnalysis] = None
 
 	def filename_slug(self) -> str:
-		def _slug(value: str) -> str:
-			value = re.sub(r"[^a-zA-Z0-9]+", "-", value.strip()).strip("- ")
-			return value.lower()[:60] if value else "item"
-
 		return f"{self.sequence:03d}_{_slug(self.participant_name)}_{_slug(self.theme)}"
 
 
@@ -203,68 +272,68 @@ class CSVSubmissionRepository:
 	}
 
 	def __init__(self) -> None:
-		self._header_map: Dict[str, str] = {}
+		self._index_map: Dict[str, int] = {}
 
 	def read_submissions(self, csv_path: Path) -> List[ParticipantPhoto]:
+		return list(self.iter_submissions(csv_path))
+
+	def iter_submissions(self, csv_path: Path) -> Iterator[ParticipantPhoto]:
+		"""Validate the header, then yield photos lazily."""
 		csv_path = Path(csv_path)
 		if not csv_path.exists():
 			raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-		with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
-			reader = csv.DictReader(handle)
-			self._prepare_header_map(reader.fieldnames or [])
+		handle = csv_path.open("r", encoding="utf-8-sig", newline="")
+		try:
+			reader = csv.reader(handle)
+			pick = self._prepare_header_indices(next(reader, []))
+		except BaseException:
+			handle.close()
+			raise
+		return self._iter_photos(handle, reader, pick, max(self._index_map.values()) + 1)
+
+	def _iter_photos(self, handle: TextIO, reader: Iterator[List[str]], pick: itemgetter, width: int) -> Iterator[ParticipantPhoto]:
+		with handle:
 			sequence = 1
-			photos: List[ParticipantPhoto] = []
-			for submission_index, row in enumerate(reader, start=1):
-				entry = self._map_row(row)
-				if not entry:
-					continue
-				links = self._split_links(entry["photo_links"])
-				if not links:
+			for submission_index, row in enumerate(filter(None, reader), start=1):
+				if len(row) < width:
+					row += [""] * (width - len(row))
+				participant_name, theme, description, photo_links = pick(row)
+				participant_name = participant_name.strip()
+				theme = sys.intern(theme.strip())
+				if not participant_name or not theme:
 					continue
-				for link in links:
-					photos.append(
-						ParticipantPhoto(
-							sequence=sequence,
-							submission_index=submission_index,
-							participant_name=entry["participant_name"],
-							theme=entry["theme"],
-							description=entry["description"],
-							url=link,
-						)
+				description = description.strip()
+				for link in self._split_links(photo_links):
+					yield ParticipantPhoto(
+						sequence=sequence,
+						submission_index=submission_index,
+						participant_name=participant_name,
+						theme=theme,
+						description=description,
+						url=link,
 					)
 					sequence += 1
-		return photos
 
-	def _prepare_header_map(self, headers: Iterable[str]) -> None:
-		self._header_map.clear()
-		for raw_header in headers:
+	def _prepare_header_indices(self, headers: Iterable[str]) -> itemgetter:
+		self._index_map.clear()
+		for index, raw_header in enumerate(headers):
 			key = self._normalize_key(raw_header)
 			if key in self.REQUIRED_KEYS:
-				self._header_map[self.REQUIRED_KEYS[key]] = raw_header
-		missing = [label for label, alias in self.REQUIRED_KEYS.items() if alias not in self._header_map]
+				self._index_map[self.REQUIRED_KEYS[key]] = index
+		missing = [label for label, alias in self.REQUIRED_KEYS.items() if alias not in self._index_map]
 		if missing:
 			readable = ", ".join(sorted(missing))
 			raise ValueError(f"Missing expected columns in CSV: {readable}")
-
-	def _map_row(self, row: Dict[str, str]) -> Optional[Dict[str, str]]:
-		mapped: Dict[str, str] = {}
-		for alias, header in self._header_map.items():
-			mapped[alias] = (row.get(header) or "").strip()
-		if not mapped["participant_name"] or not mapped["theme"]:
-			return None
-		return mapped
+		return itemgetter(*(self._index_map[alias] for alias in self.REQUIRED_KEYS.values()))
 
 	@staticmethod
 	def _normalize_key(value: str) -> str:
-		return re.sub(r"\s+", " ", value.lower()).strip()
+		return " ".join(value.lower().split())
 
 	@staticmethod
 	def _split_links(value: str) -> List[str]:
-		if not value:
-			return []
-		chunks = [chunk.strip() for chunk in value.split(",")]
-		return [chunk for chunk in chunks if chunk]
+		return [chunk for chunk in map(str.strip, value.split(",")) if chunk]
 
 
 class PhotoDownloadError(Exception):
@@ -275,50 +344,134 @@ class ImageDownloadService:
 	"""Facade for downloading remote images (Google Drive aware)."""
 
 	DRIVE_HOST = "drive.google.com"
+	MAX_CONCURRENT_DOWNLOADS = 32
+	TIMEOUT = (5, 60)
+	CHUNK_SIZE = 1024 * 1024
 
-	def __init__(self, session: Optional[requests.Session] = None) -> None:
-		self.session = session or requests.Session()
+	def __init__(
+		self,
+		session: Optional[requests.Session] = None,
+		max_workers: int = MAX_CONCURRENT_DOWNLOADS,
+		revalidate: bool = False,
+	) -> None:
+		self.max_workers = max(1, max_workers)
+		self.revalidate = revalidate
+		self.session = session or self._build_session(self.max_workers)
+		self._entry_locks: Dict[Path, threading.Lock] = {}
+		self._entry_locks_guard = threading.Lock()
+
+	@staticmethod
+	def _build_session(pool_size: int) -> requests.Session:
+		session = requests.Session()
+		retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+		adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+		session.mount("https://", adapter)
+		session.mount("http://", adapter)
+		return session
 
 	def download(self, url: str, output_dir: Path) -> Path:
 		if not url:
 			raise PhotoDownloadError("Empty URL provided")
 
 		output_dir.mkdir(parents=True, exist_ok=True)
-		if self.DRIVE_HOST in url:
-			return self._download_from_drive(url, output_dir)
-		return self._download_generic(url, output_dir)
+		target = self._cached_path(url, output_dir)
+		with self._entry_locks_guard:
+			lock = self._entry_locks.setdefault(target, threading.Lock())
+		with lock:
+			return self._download_entry(url, target)
+
+	def _download_entry(self, url: str, target: Path) -> Path:
+		etag_path = target.with_name(target.name + ".etag")
+		headers: Dict[str, str] = {}
+		if target.exists() and target.stat().st_size > 0:
+			if not (self.revalidate and etag_path.exists()):
+				return target
+			headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+		try:
+			if self.DRIVE_HOST in url:
+				response = self._request_drive(url, headers)
+			else:
+				response = self._request_generic(url, headers)
+			if response.status_code == 304:
+				response.close()
+				return target
+			self._write_response(response, target)
+		except requests.RequestException as err:
+			raise PhotoDownloadError(f"Unable to download image: {url} ({err})") from err
+		etag = response.headers.get("ETag")
+		if etag:
+			etag_path.write_text(etag, encoding="utf-8")
+		return target
 
-	def _download_generic(self, url: str, output_dir: Path) -> Path:
-		response = self.session.get(url, stream=True, timeout=60)
+	@staticmethod
+	def _cached_path(url: str, cache_dir: Path) -> Path:
+		suffix = Path(urlparse(url).path).suffix.lower()
+		if not (1 < len(suffix) <= 5 and suffix[1:].isalnum()):
+			suffix = ".jpg"
+		return cache_dir / (hashlib.sha1(url.encode("utf-8")).hexdigest() + suffix)
+
+	def _request_generic(self, url: str, headers: Dict[str, str]) -> requests.Response:
+		response = self.session.get(url, headers=headers, stream=True, timeout=self.TIMEOUT)
 		if not response.ok:
 			raise PhotoDownloadError(f"Unable to download image: {url}")
-		filename = self._resolve_filename(url, response.headers.get("Content-Disposition"))
-		target = output_dir / filename
-		with target.open("wb") as handle:
-			for chunk in response.iter_content(1024 * 32):
-				handle.write(chunk)
-		return target
+		return response
 
-	def _download_from_drive(self, url: str, output_dir: Path) -> Path:
+	def _request_drive(self, url: str, headers: Dict[str, str]) -> requests.Response:
 		file_id = self._extract_drive_id(url)
 		if not file_id:
 			raise PhotoDownloadError(f"Unable to parse Google Drive id: {url}")
 		download_url = "https://drive.google.com/uc?export=download"
 		params = {"id": file_id}
-		response = self.session.get(download_url, params=params, stream=True)
+		response = self.session.get(download_url, params=params, headers=headers, stream=True, timeout=self.TIMEOUT)
 		token = self._drive_confirm_token(response)
 		if token:
+			response.close()
 			params["confirm"] = token
-			response = self.session.get(download_url, params=params, stream=True)
+			response = self.session.get(download_url, params=params, headers=headers, stream=True, timeout=self.TIMEOUT)
 		if not response.ok:
 			raise PhotoDownloadError(f"Drive download failed for id {file_id}")
-		disposition = response.headers.get("Content-Disposition")
-		filename = self._resolve_filename(file_id, disposition)
-		target = output_dir / filename
-		with target.open("wb") as handle:
-			for chunk in response.iter_content(1024 * 32):
-				handle.write(chunk)
-		return target
+		return response
+
+	@classmethod
+	def _write_response(cls, response: requests.Response, target: Path) -> None:
+		fd, partial = tempfile.mkstemp(dir=target.parent, prefix=target.name + ".", suffix=".part")
+		try:
+			try:
+				length = response.headers.get("Content-Length", "")
+				if length.isdigit() and int(length) <= cls.CHUNK_SIZE:
+					chunks: Iterable[bytes] = (response.content,)
+				else:
+					chunks = response.iter_content(cls.CHUNK_SIZE)
+				for chunk in chunks:
+					view = memoryview(chunk)
+					while view:
+						view = view[os.write(fd, view):]
+			finally:
+				os.close(fd)
+			try:
+				with Image.open(partial) as probe:
+					probe.verify()
+			except Exception as err:  # noqa: BLE001
+				content_type = response.headers.get("Content-Type", "unknown type")
+				raise PhotoDownloadError(f"Response is not a readable image ({content_type}): {response.url}") from err
+			os.chmod(partial, 0o644)
+			try:
+				os.replace(partial, target)
+			except OSError:
+				# Lost the rename to another download of the same entry; its copy is the cache hit.
+				if not (target.exists() and target.stat().st_size > 0):
+					raise
+		finally:
+			if os.path.exists(partial):
+				os.remove(partial)
+
+	@staticmethod
+	def discard(path: Path) -> None:
+		for stale in (Path(path), Path(path).with_name(Path(path).name + ".etag")):
+			try:
+				stale.unlink()
+			except FileNotFoundError:
+				pass
 
 	@staticmethod
 	def _drive_confirm_token(response: requests.Response) -> Optional[str]:
@@ -327,27 +480,10 @@ class ImageDownloadService:
 				return value
 		return None
 
-	@staticmethod
-	def _resolve_filename(base: str, content_disposition: Optional[str]) -> str:
-		if content_disposition:
-			match = re.search(r"filename\*=UTF-8''([^;]+)", content_disposition)
-			if match:
-				return match.group(1)
-			match = re.search(r'filename="([^"]+)"', content_disposition)
-			if match:
-				return match.group(1)
-		stem = re.sub(r"[^a-zA-Z0-9_-]+", "", base)
-		return f"{stem or 'download'}.jpg"
-
 	@staticmethod
 	def _extract_drive_id(url: str) -> Optional[str]:
-		patterns = [
-			r"id=([a-zA-Z0-9_-]{10,})",
-			r"/d/([a-zA-Z0-9_-]{10,})",
-			r"file/d/([a-zA-Z0-9_-]{10,})",
-		]
-		for pattern in patterns:
-			match = re.search(pattern, url)
+		for pattern in _DRIVE_ID_RES:
+			match = pattern.search(url)
 			if match:
 				return match.group(1)
 		return None
@@ -356,14 +492,23 @@ class ImageDownloadService:
 class OrientationDetector:
 	"""Detect orientation by inspecting image dimensions and EXIF metadata."""
 
+	EXIF_ORIENTATION_TAG = 0x0112
+	ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
 	def __init__(self, square_tolerance: float = 0.08, square_preference: Orientation = Orientation.LANDSCAPE) -> None:
 		self.square_tolerance = square_tolerance
 		self.square_preference = square_preference
 
 	def analyze(self, image_path: Path) -> PhotoAnalysis:
 		with Image.open(image_path) as img:
-			img = ImageOps.exif_transpose(img)
-			width, height = img.size
+			return self.analyze_image(img)
+
+	def analyze_image(self, img: Image.Image) -> PhotoAnalysis:
+		return self._analysis(img.width, img.height, img.getexif().get(self.EXIF_ORIENTATION_TAG, 1))
+
+	def _analysis(self, width: int, height: int, exif_orientation: int) -> PhotoAnalysis:
+		if exif_orientation in self.ROTATED_ORIENTATIONS:
+			width, height = height, width
 		aspect_ratio = width / height if height else 1.0
 		orientation = self._decide_orientation(width, height, aspect_ratio)
 		return PhotoAnalysis(width=width, height=height, orientation=orientation, aspect_ratio=aspect_ratio)
@@ -385,12 +530,25 @@ class FontProvider:
 	def __init__(self) -> None:
 		self._cache: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
 
+	def __getstate__(self) -> Dict[str, object]:
+		return {}
+
+	def __setstate__(self, state: Dict[str, object]) -> None:
+		self.__init__()
+
 	def get(self, style: TextStyle) -> ImageFont.ImageFont:
 		key = (style.font_path or "default", style.font_size)
 		if key not in self._cache:
 			self._cache[key] = self._load(style)
 		return self._cache[key]
 
+	@staticmethod
+	def line_height(font: ImageFont.ImageFont) -> int:
+		try:
+			return font.getbbox("A")[3]
+		except AttributeError:
+			return font.getsize("A")[1]
+
 	@staticmethod
 	def _load(style: TextStyle) -> ImageFont.ImageFont:
 		font_path = style.font_path or "arial.ttf"
@@ -403,62 +561,123 @@ class FontProvider:
 class TemplateRenderer:
 	"""Strategy that renders participant content on top of template."""
 
+	LENGTH_CACHE_SIZE = 4096
+
 	def __init__(self, font_provider: Optional[FontProvider] = None) -> None:
 		self.font_provider = font_provider or FontProvider()
+		self._template_cache: Dict[str, Tuple[float, Image.Image]] = {}
+		self._length_cache: Dict[Tuple[ImageFont.ImageFont, str], float] = {}
+
+	def __getstate__(self) -> Dict[str, object]:
+		return {"font_provider": self.font_provider}
+
+	def __setstate__(self, state: Dict[str, object]) -> None:
+		self.__init__(state["font_provider"])
 
-	def render(self, layout: TemplateLayout, photo: ParticipantPhoto) -> Image.Image:
+	def render(self, layout: TemplateLayout, photo: ParticipantPhoto, source: Optional[Image.Image] = None) -> Image.Image:
 		layout.ensure_template_exists()
-		template = Image.open(layout.template_path).convert("RGBA")
-		self._paste_photo(template, layout.photo_area, Path(photo.local_path))
+		template = self._load_template(layout.template_path)
+		if source is not None:
+			self._paste_photo(template, layout.photo_area, source)
+		else:
+			if not photo.local_path:
+				raise ValueError("No photo path provided")
+			with Image.open(photo.local_path) as image:
+				self._paste_photo(template, layout.photo_area, image)
+		metrics = layout.prepare(self.font_provider)
 		draw = ImageDraw.Draw(template)
-		self._draw_text(draw, layout.clicked_by, photo.participant_name)
-		self._draw_text(draw, layout.title, photo.theme)
-		self._draw_text(draw, layout.description, photo.description)
+		self._draw_text(draw, layout.clicked_by, photo.participant_name, metrics["clicked_by"])
+		self._draw_text(draw, layout.title, photo.theme, metrics["title"])
+		self._draw_text(draw, layout.description, photo.description, metrics["description"])
 		if layout.badge and layout.badge.visible and layout.badge_format:
 			badge_text = layout.badge_format.format(photo.sequence)
-			self._draw_text(draw, layout.badge, badge_text)
-		return template.convert("RGB")
+			self._draw_text(draw, layout.badge, badge_text, metrics["badge"])
+		return template if template.mode == "RGB" else template.convert("RGB")
+
+	def preload(self, template_path: str) -> Image.Image:
+		"""Return the shared decoded template, decoding again only when the file changes."""
+		mtime = os.stat(template_path).st_mtime
+		cached = self._template_cache.get(template_path)
+		if not cached or cached[0] != mtime:
+			with Image.open(template_path) as image:
+				has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+				cached = (mtime, image.convert("RGBA" if has_alpha else "RGB"))
+			self._template_cache[template_path] = cached
+		return cached[1]
+
+	def _load_template(self, template_path: str) -> Image.Image:
+		return self.preload(template_path).copy()
+
+	def _paste_photo(self, canvas: Image.Image, area: Rectangle, image: Image.Image) -> None:
+		size = (area.width, area.height)
+		image.draft("RGB", (area.width * 2, area.height * 2))
+		source = image if image.mode == "RGB" else image.convert("RGB")
+		fitted = source.resize(size, Image.Resampling.BICUBIC, box=self._fit_box(source.size, size), reducing_gap=2.0)
+		canvas.paste(fitted, (area.x, area.y))
 
-	def _paste_photo(self, canvas: Image.Image, area: Rectangle, source_path: Path) -> None:
-		if not source_path:
-			raise ValueError("No photo path provided")
-		with Image.open(source_path).convert("RGB") as source:
-			fitted = ImageOps.fit(source, (area.width, area.height), method=Image.Resampling.LANCZOS)
-			canvas.paste(fitted, (area.x, area.y))
+	@staticmethod
+	def _fit_box(source_size: Tuple[int, int], size: Tuple[int, int]) -> Tuple[float, float, float, float]:
+		"""Centred crop box matching the aspect ratio of size."""
+		width, height = source_size
+		target_ratio = size[0] / size[1]
+		if width / height >= target_ratio:
+			crop_width, crop_height = target_ratio * height, height
+		else:
+			crop_width, crop_height = width, width / target_ratio
+		left = (width - crop_width) / 2
+		top = (height - crop_height) / 2
+		return left, top, left + crop_width, top + crop_height
 
-	def _draw_text(self, draw: ImageDraw.ImageDraw, field: TextField, text: str) -> None:
+	def _draw_text(
+		self,
+		draw: ImageDraw.ImageDraw,
+		field: TextField,
+		text: str,
+		metrics: Tuple[ImageFont.ImageFont, int, int],
+	) -> None:
 		if not field.visible:
 			return
-		font = self.font_provider.get(field.style)
+		font, line_height, max_lines = metrics
 		content = f"{field.prefix}{text or ''}".strip()
 		if field.uppercase:
 			content = content.upper()
 		if not content:
 			return
-		lines = self._wrap_text(draw, content, font, field.rect.width)
-		x, y = field.rect.x, field.rect.y
-		for line in lines:
-			line_width, line_height = self._measure_text(draw, line, font)
-			x_position = x
-			if field.style.align == "center":
-				x_position = x + max((field.rect.width - line_width) // 2, 0)
-			elif field.style.align == "right":
-				x_position = x + max(field.rect.width - line_width, 0)
-			draw.text((x_position, y), line, font=font, fill=field.style.fill)
-			y += line_height + field.style.line_spacing
-			if y > field.rect.y + field.rect.height:
-				break
-
-	def _measure_text(self, draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont) -> Tuple[int, int]:
-		if not text:
-			return 0, font.size
-		try:
-			bbox = draw.textbbox((0, 0), text, font=font)
-			width = bbox[2] - bbox[0]
-			height = bbox[3] - bbox[1]
-		except AttributeError:
-			width, height = font.getsize(text)
-		return width, height or font.size
+		lines = self._wrap_text(draw, content, font, field.rect.width)[:max_lines]
+		align = field.style.align if field.style.align in ("center", "right") else "left"
+		x = field.rect.x
+		if align != "left":
+			widths = [int(self._text_length(font, line)) for line in lines]
+			if max(widths) > field.rect.width:
+				# multiline_text would align the other lines against the overflowing one.
+				for row, (line, width) in enumerate(zip(lines, widths)):
+					slack = max(field.rect.width - width, 0)
+					offset = slack // 2 if align == "center" else slack
+					draw.text((x + offset, field.rect.y + row * line_height), line, font=font, fill=field.style.fill)
+				return
+			slack = field.rect.width - max(widths)
+			x += slack // 2 if align == "center" else slack
+		draw.multiline_text(
+			(x, field.rect.y),
+			"\n".join(lines),
+			font=font,
+			fill=field.style.fill,
+			spacing=field.style.line_spacing,
+			align=align,
+		)
+
+	def _text_length(self, font: ImageFont.ImageFont, text: str) -> float:
+		key = (font, text)
+		length = self._length_cache.get(key)
+		if length is None:
+			try:
+				length = font.getlength(text)
+			except AttributeError:
+				length = font.getsize(text)[0]
+			if len(self._length_cache) >= self.LENGTH_CACHE_SIZE:
+				self._length_cache.clear()
+			self._length_cache[key] = length
+		return length
 
 	def _wrap_text(self, draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
 		if not text:
@@ -466,16 +685,20 @@ class TemplateRenderer:
 		words = text.split()
 		if not words:
 			return []
+		measure = self._text_length
+		space_width = measure(font, " ")
 		lines: List[str] = []
 		current: List[str] = []
+		current_width = 0.0
 		for word in words:
-			candidate = " ".join(current + [word]) if current else word
-			width, _ = self._measure_text(draw, candidate, font)
-			if width <= max_width or not current:
-				current.append(word)
-			else:
+			word_width = measure(font, word)
+			if current and current_width + space_width + word_width > max_width:
 				lines.append(" ".join(current))
 				current = [word]
+				current_width = word_width
+			else:
+				current_width += space_width + word_width if current else word_width
+				current.append(word)
 		if current:
 			lines.append(" ".join(current))
 		return lines
@@ -500,6 +723,9 @@ class TemplateManager:
 	def get_source_path(self, orientation: Orientation) -> Optional[Path]:
 		return self._sources.get(orientation)
 
+	def layouts(self) -> List[TemplateLayout]:
+		return list(self._layouts.values())
+
 
 class GenerationController:
 	"""Control object that supports pausing and stopping generation."""
@@ -539,17 +765,48 @@ class GenerationController:
 class PostGenerationService:
 	"""Coordinator that generates posts for the provided submissions."""
 
+	OUTPUT_FORMATS: Dict[str, Tuple[str, Dict[str, Dict[str, object]]]] = {
+		"PNG": (".png", {
+			"fast": {"compress_level": 1, "optimize": False},
+			"small": {"compress_level": 9, "optimize": True},
+		}),
+		"WEBP": (".webp", {
+			"fast": {"quality": 85, "method": 4},
+			"small": {"quality": 80, "method": 6},
+		}),
+		"JPEG": (".jpg", {
+			"fast": {"quality": 90, "optimize": False, "progressive": False, "subsampling": 2},
+			"small": {"quality": 85, "optimize": True, "progressive": True, "subsampling": 2},
+		}),
+	}
+	SAVE_PROFILES = ("fast", "small")
+
 	def __init__(
 		self,
 		template_manager: TemplateManager,
 		renderer: TemplateRenderer,
 		downloader: ImageDownloadService,
 		orientation_detector: OrientationDetector,
+		render_workers: Optional[int] = None,
+		queue_size: int = 32,
+		output_format: str = "PNG",
+		save_profile: str = "fast",
 	) -> None:
+		output_format = output_format.upper()
+		if output_format not in self.OUTPUT_FORMATS:
+			raise ValueError(f"Unsupported output format: {output_format}")
+		if save_profile not in self.SAVE_PROFILES:
+			raise ValueError(f"Unsupported save profile: {save_profile}")
 		self.template_manager = template_manager
 		self.renderer = renderer
 		self.downloader = downloader
 		self.orientation_detector = orientation_detector
+		self.render_workers = max(1, render_workers or os.cpu_count() or 1)
+		self.queue_size = max(1, queue_size)
+		self.output_format = output_format
+		self.save_profile = save_profile
+		self._pool: Optional[ProcessPoolExecutor] = None
+		self._pool_signature: Optional[List[object]] = None
 
 	def generate(
 		self,
@@ -563,60 +820,209 @@ class PostGenerationService:
 		cache_dir = Path(cache_dir)
 		output_dir.mkdir(parents=True, exist_ok=True)
 		cache_dir.mkdir(parents=True, exist_ok=True)
-		results: List[Path] = []
-		for index, photo in enumerate(photos, start=1):
-			if controller:
-				if controller.should_stop():
-					break
-				controller.wait_if_paused()
-				if controller.should_stop():
-					break
-			if progress_callback:
-				progress_callback(f"Downloading ({index}): {photo.url}")
+		ready: "queue.Queue[Tuple[Optional[int], object]]" = queue.Queue(maxsize=self.queue_size)
+		slots = threading.Semaphore(self.queue_size + self.downloader.max_workers)
+		aborted = threading.Event()
+		feed_errors: List[Exception] = []
+
+		def produce(index: int, photo: ParticipantPhoto) -> None:
+			downloaded: Optional[ParticipantPhoto] = None
 			try:
-				local = self.downloader.download(photo.url, cache_dir)
-			except PhotoDownloadError as err:
+				if aborted.is_set() or self._stopping(controller):
+					return
 				if progress_callback:
-					progress_callback(f"Download failed: {err}")
-				continue
-			photo.local_path = local
-			if controller:
-				if controller.should_stop():
-					break
-				controller.wait_if_paused()
-				if controller.should_stop():
-					break
-			analysis = self.orientation_detector.analyze(local)
-			photo.analysis = analysis
+					progress_callback(f"Downloading ({index}): {photo.url}")
+				try:
+					photo.local_path = self.downloader.download(photo.url, cache_dir)
+				except Exception as err:  # noqa: BLE001
+					if progress_callback:
+						progress_callback(f"Download failed: {err}")
+					return
+				downloaded = photo
+			finally:
+				ready.put((index, downloaded))
+
+		def feed(download_pool: ThreadPoolExecutor) -> None:
+			submitted = 0
 			try:
-				layout = self._select_layout(analysis)
-			except ValueError as err:
-				if progress_callback:
-					progress_callback(str(err))
-				continue
-			photo.orientation = layout.orientation
+				for index, photo in enumerate(photos, start=1):
+					slots.acquire()
+					if aborted.is_set() or self._stopping(controller):
+						slots.release()
+						break
+					download_pool.submit(produce, index, photo)
+					submitted += 1
+			except Exception as err:  # noqa: BLE001
+				feed_errors.append(err)
+			finally:
+				close = getattr(photos, "close", None)
+				if close:
+					close()
+				ready.put((None, submitted))
+
+		finished: List[Tuple[int, Path]] = []
+		pending: Set[Future] = set()
+
+		def report(future: Future) -> None:
+			if future.cancelled() or future.exception() is not None:
+				return
+			for message in future.result()[1]:
+				progress_callback(message)
+
+		def collect(done: Iterable[Future]) -> None:
+			for future in done:
+				pending.discard(future)
+				if future.cancelled():
+					continue
+				entry, _ = future.result()
+				if entry:
+					finished.append(entry)
+
+		render_pool = self._render_pool()
+		save_settings = self._save_settings()
+		with ThreadPoolExecutor(max_workers=self.downloader.max_workers) as download_pool:
+			threading.Thread(target=feed, args=(download_pool,), daemon=True).start()
+			received = 0
+			total: Optional[int] = None
 			try:
-				layout.ensure_template_exists()
-			except (ValueError, FileNotFoundError) as err:
-				if progress_callback:
-					progress_callback(str(err))
-				continue
+				while total is None or received < total:
+					index, photo = ready.get()
+					if index is None:
+						total = photo
+						continue
+					received += 1
+					slots.release()
+					if photo is None or self._halted(controller):
+						continue
+					if len(pending) >= self.render_workers:
+						done, _ = wait(pending, return_when=FIRST_COMPLETED)
+						collect(done)
+					future = render_pool.submit(_render_worker, index, photo, output_dir, save_settings)
+					if progress_callback:
+						future.add_done_callback(report)
+					pending.add(future)
+				if feed_errors:
+					raise feed_errors[0]
+				if controller and controller.should_stop():
+					for future in pending:
+						future.cancel()
+				collect(as_completed(list(pending)))
+			except BrokenProcessPool:
+				self.shutdown()
+				raise
+			finally:
+				aborted.set()
+				for future in pending:
+					future.cancel()
+				while total is None or received < total:
+					index, photo = ready.get()
+					if index is None:
+						total = photo
+					else:
+						received += 1
+						slots.release()
+		finished.sort(key=lambda entry: entry[0])
+		return [path for _, path in finished]
+
+	def _render_one(
+		self,
+		index: int,
+		photo: ParticipantPhoto,
+		output_dir: Path,
+		progress_callback=None,
+		controller: Optional[GenerationController] = None,
+		save_settings: Optional[Tuple[str, str, Dict[str, object]]] = None,
+	) -> Optional[Tuple[int, Path]]:
+		if self._halted(controller):
+			return None
+		try:
+			image = Image.open(photo.local_path)
+		except UnidentifiedImageError as err:
+			ImageDownloadService.discard(photo.local_path)
 			if progress_callback:
-				progress_callback(
-					f"Rendering ({index}) using {photo.orientation.value} template (aspect {analysis.aspect_ratio:.2f})"
-				)
-			if controller:
-				controller.wait_if_paused()
-				if controller.should_stop():
-					break
-			composed = self.renderer.render(layout, photo)
-			filename = f"{photo.filename_slug()}.png"
-			output_path = output_dir / filename
-			composed.save(output_path, format="PNG")
-			results.append(output_path)
+				progress_callback(f"Removed unreadable cached photo ({index}): {err}")
+			return None
+		with image:
+			return self._render_image(index, photo, image, output_dir, progress_callback, controller, save_settings)
+
+	def _render_image(
+		self,
+		index: int,
+		photo: ParticipantPhoto,
+		image: Image.Image,
+		output_dir: Path,
+		progress_callback=None,
+		controller: Optional[GenerationController] = None,
+		save_settings: Optional[Tuple[str, str, Dict[str, object]]] = None,
+	) -> Optional[Tuple[int, Path]]:
+		analysis = self.orientation_detector.analyze_image(image)
+		photo.analysis = analysis
+		try:
+			layout = self._select_layout(analysis)
+		except ValueError as err:
 			if progress_callback:
-				progress_callback(f"Saved {output_path.name}")
-		return results
+				progress_callback(str(err))
+			return None
+		photo.orientation = layout.orientation
+		try:
+			layout.ensure_template_exists()
+		except (ValueError, FileNotFoundError) as err:
+			if progress_callback:
+				progress_callback(str(err))
+			return None
+		if progress_callback:
+			progress_callback(
+				f"Rendering ({index}) using {photo.orientation.value} template (aspect {analysis.aspect_ratio:.2f})"
+			)
+		if self._halted(controller):
+			return None
+		composed = self.renderer.render(layout, photo, source=image)
+		output_format, extension, save_options = save_settings or self._save_settings()
+		filename = f"{photo.filename_slug()}{extension}"
+		output_path = output_dir / filename
+		composed.save(output_path, format=output_format, **save_options)
+		if progress_callback:
+			progress_callback(f"Saved {output_path.name}")
+		return index, output_path
+
+	def _save_settings(self) -> Tuple[str, str, Dict[str, object]]:
+		extension, profiles = self.OUTPUT_FORMATS[self.output_format]
+		return self.output_format, extension, profiles[self.save_profile]
+
+	def _render_pool(self) -> ProcessPoolExecutor:
+		"""Return the long-lived render pool, restarting it only when the layouts changed."""
+		signature = [layout.to_dict() for layout in self.template_manager.layouts()]
+		if self._pool is None or signature != self._pool_signature:
+			self.shutdown()
+			self._pool = ProcessPoolExecutor(
+				max_workers=self.render_workers, initializer=_init_render_worker, initargs=(self,)
+			)
+			self._pool_signature = signature
+		return self._pool
+
+	def shutdown(self) -> None:
+		if self._pool is not None:
+			self._pool.shutdown(wait=False, cancel_futures=True)
+		self._pool = None
+		self._pool_signature = None
+
+	def __getstate__(self) -> Dict[str, object]:
+		state = self.__dict__.copy()
+		state["downloader"] = None
+		state["_pool"] = None
+		state["_pool_signature"] = None
+		return state
+
+	@staticmethod
+	def _stopping(controller: Optional[GenerationController]) -> bool:
+		return bool(controller and controller.should_stop())
+
+	@staticmethod
+	def _halted(controller: Optional[GenerationController]) -> bool:
+		if not controller:
+			return False
+		controller.wait_if_paused()
+		return controller.should_stop()
 
 	@staticmethod
 	def _aspect_ratio(rect: Rectangle) -> float:
@@ -644,36 +1050,85 @@ class PostGenerationService:
 		return candidates[0][1]
 
 
+_RENDER_SERVICE: Optional[PostGenerationService] = None
+
+
+def _init_render_worker(service: PostGenerationService) -> None:
+	global _RENDER_SERVICE
+	_RENDER_SERVICE = service
+	for layout in service.template_manager.layouts():
+		layout.prepare(service.renderer.font_provider)
+		try:
+			service.renderer.preload(layout.template_path)
+		except (OSError, ValueError):
+			pass  # reported per photo at render time
+
+
+def _render_worker(
+	index: int,
+	photo: ParticipantPhoto,
+	output_dir: Path,
+	save_settings: Tuple[str, str, Dict[str, object]],
+) -> Tuple[Optional[Tuple[int, Path]], List[str]]:
+	messages: List[str] = []
+	entry = _RENDER_SERVICE._render_one(index, photo, output_dir, progress_callback=messages.append, save_settings=save_settings)
+	return entry, messages
+
+
 class LogHandler:
 	"""Thread-safe logger for the GUI."""
 
+	FLUSH_INTERVAL_MS = 50
+	MAX_LINES = 5000
+	TRANSIENT_PREFIXES = ("Downloading (", "Rendering (")
+	TRANSIENT_TAG = "progress"
+
 	def __init__(self, widget: tk.Text) -> None:
 		self.widget = widget
 		self.queue: "queue.Queue[str]" = queue.Queue()
-		self.widget.after(100, self._poll)
+		self._lock = threading.Lock()
+		self._scheduled = False
 
 	def write(self, message: str) -> None:
 		self.queue.put(message)
+		with self._lock:
+			if self._scheduled:
+				return
+			self._scheduled = True
+		self.widget.after(self.FLUSH_INTERVAL_MS, self._drain)
 
-	def _poll(self) -> None:
+	def _drain(self) -> None:
+		with self._lock:
+			self._scheduled = False
+		batch: List[str] = []
 		try:
 			while True:
-				message = self.queue.get_nowait()
-				self.widget.insert("end", message + "\n")
-				self.widget.see("end")
+				batch.append(self.queue.get_nowait())
 		except queue.Empty:
 			pass
-		finally:
-			self.widget.after(100, self._poll)
+		if batch:
+			current = self.widget.tag_ranges(self.TRANSIENT_TAG)
+			if current:
+				self.widget.delete(*current)
+			lines = [message for message in batch if not message.startswith(self.TRANSIENT_PREFIXES)]
+			if lines:
+				self.widget.insert("end", "\n".join(lines) + "\n")
+			if batch[-1].startswith(self.TRANSIENT_PREFIXES):
+				self.widget.insert("end", batch[-1] + "\n", self.TRANSIENT_TAG)
+			# "end-1c" sits on the empty line after the last newline, so it counts one past the text.
+			excess = int(self.widget.index("end-1c").split(".")[0]) - 1 - self.MAX_LINES
+			if excess > 0:
+				self.widget.delete("1.0", f"{excess + 1}.0")
+			self.widget.see("end")
 
 
 class TemplateEditor(tk.Toplevel):
 	FIELD_DEFINITIONS: Dict[str, Dict[str, object]] = {
-		"photo": {"label": "Photo Area", "has_style": False},
-		"badge": {"label": "Badge Number", "has_style": True},
-		"clicked_by": {"label": "Clicked By", "has_style": True},
-		"title": {"label": "Title", "has_style": True},
-		"description": {"label": "Description", "has_style": True},
+		"photo": {"label": "Photo Area", "has_style": False, "color": "#2f80ed"},
+		"badge": {"label": "Badge Number", "has_style": True, "color": "#9b51e0"},
+		"clicked_by": {"label": "Clicked By", "has_style": True, "color": "#27ae60"},
+		"title": {"label": "Title", "has_style": True, "color": "#f2994a"},
+		"description": {"label": "Description", "has_style": True, "color": "#eb5757"},
 	}
 
 	def __init__(self, master: tk.Tk, orientation: Orientation, layout: Optional[TemplateLayout], apply_callback) -> None:
@@ -697,7 +1152,9 @@ class TemplateEditor(tk.Toplevel):
 
 		self._image_tk: Optional[ImageTk.PhotoImage] = None
 		self._display_scale: float = 1.0
+		self._image_source: Optional[Tuple[str, float]] = None
 		self._rect_items: Dict[str, int] = {}
+		self._drawn_rects: Dict[str, Tuple[Tuple[int, int, int, int], str, Optional[Tuple[int, int]]]] = {}
 		self._drag_start: Optional[Tuple[int, int]] = None
 		self._current_field = tk.StringVar(value="photo")
 
@@ -842,35 +1299,54 @@ class TemplateEditor(tk.Toplevel):
 		self._load_template_image(Path(path))
 
 	def _load_template_image(self, path: Path) -> None:
+		source = (str(path), path.stat().st_mtime)
+		if self._image_tk is not None and source == self._image_source:
+			self._draw_existing_rectangles()
+			return
 		image = Image.open(path)
 		self._image = image
+		self._image_source = source
 		max_width, max_height = 740, 680
 		scale = min(max_width / image.width, max_height / image.height, 1.0)
 		self._display_scale = scale
 		display = image.resize((int(image.width * scale), int(image.height * scale)))
 		self._image_tk = ImageTk.PhotoImage(display)
 		self.canvas.delete("all")
+		self._rect_items.clear()
+		self._drawn_rects.clear()
 		self.canvas.create_image(0, 0, anchor="nw", image=self._image_tk)
 		self.canvas.configure(scrollregion=(0, 0, display.width, display.height))
 		self._draw_existing_rectangles()
 
 	def _draw_existing_rectangles(self) -> None:
-		self.canvas.delete("rect")
+		for field_key in self.FIELD_DEFINITIONS:
+			self._sync_rect_item(field_key)
 
-		def draw_field(name: str, rect: Rectangle, color: str, visible: bool = True) -> None:
-			if not rect:
+	def _sync_rect_item(self, field_key: str) -> None:
+		if field_key == "photo":
+			rect, visible = self.layout.photo_area, True
+		else:
+			text_field = self.layout.text_fields().get(field_key)
+			if not text_field:
+				item = self._rect_items.pop(field_key, None)
+				if item is not None:
+					self.canvas.delete(item)
+				self._drawn_rects.pop(field_key, None)
 				return
-			scaled = self._scale_rect(rect)
-			outline = color if visible else "#9e9e9e"
-			dash = None if visible else (4, 2)
-			self._rect_items[name] = self.canvas.create_rectangle(*scaled, outline=outline, width=2, dash=dash, tags="rect")
-
-		draw_field("photo", self.layout.photo_area, "#2f80ed")
-		if self.layout.badge:
-			draw_field("badge", self.layout.badge.rect, "#9b51e0", self.layout.badge.visible)
-		draw_field("clicked_by", self.layout.clicked_by.rect, "#27ae60", self.layout.clicked_by.visible)
-		draw_field("title", self.layout.title.rect, "#f2994a", self.layout.title.visible)
-		draw_field("description", self.layout.description.rect, "#eb5757", self.layout.description.visible)
+			rect, visible = text_field.rect, text_field.visible
+		scaled = self._scale_rect(rect)
+		outline = self.FIELD_DEFINITIONS[field_key]["color"] if visible else "#9e9e9e"
+		dash = None if visible else (4, 2)
+		state = (scaled, outline, dash)
+		if self._drawn_rects.get(field_key) == state:
+			return
+		item = self._rect_items.get(field_key)
+		if item is None:
+			self._rect_items[field_key] = self.canvas.create_rectangle(*scaled, outline=outline, width=2, dash=dash, tags="rect")
+		else:
+			self.canvas.coords(item, *scaled)
+			self.canvas.itemconfigure(item, outline=outline, width=2, dash=dash or "")
+		self._drawn_rects[field_key] = state
 
 	def _scale_rect(self, rect: Rectangle) -> Tuple[int, int, int, int]:
 		scale = self._display_scale
@@ -892,6 +1368,7 @@ class TemplateEditor(tk.Toplevel):
 		x0, y0 = self._drag_start
 		rect = (x0, y0, event.x, event.y)
 		field_key = self._current_field.get()
+		self._drawn_rects.pop(field_key, None)
 		if field_key not in self._rect_items:
 			self._rect_items[field_key] = self.canvas.create_rectangle(*rect, outline="#000", dash=(2, 2), tags="rect")
 		else:
@@ -904,10 +1381,11 @@ class TemplateEditor(tk.Toplevel):
 		self._drag_start = None
 		x1, y1 = event.x, event.y
 		rect = self._normalize_rect(x0, y0, x1, y1)
+		field_key = self._current_field.get()
 		if not rect:
+			self._sync_rect_item(field_key)
 			return
 		image_rect = self._to_image_rect(rect)
-		field_key = self._current_field.get()
 		if field_key == "photo":
 			self.layout.photo_area = image_rect
 		elif field_key == "badge":
@@ -921,7 +1399,7 @@ class TemplateEditor(tk.Toplevel):
 			self.layout.title.rect = image_rect
 		else:
 			self.layout.description.rect = image_rect
-		self._draw_existing_rectangles()
+		self._sync_rect_item(field_key)
 
 	@staticmethod
 	def _normalize_rect(x0: int, y0: int, x1: int, y1: int) -> Optional[Tuple[int, int, int, int]]:
@@ -978,9 +1456,7 @@ class TemplateEditor(tk.Toplevel):
 		path = filedialog.askopenfilename(title="Load Template Configuration", filetypes=[("Template Config", "*.json"), ("All Files", "*.*")])
 		if not path:
 			return
-		with open(path, "r", encoding="utf-8") as handle:
-			data = json.load(handle)
-		layout = TemplateLayout.from_dict(data)
+		layout = TemplateLayout.from_dict(_load_json(Path(path)))
 		if layout.orientation != self.orientation:
 			messagebox.showerror("Orientation Mismatch", "Loaded template orientation does not match the editor mode.")
 			return
@@ -1017,10 +1493,14 @@ class SnapshotApp(tk.Tk):
 		)
 		self._controller: Optional[GenerationController] = None
 		self._generation_thread: Optional[threading.Thread] = None
+		self._layout_cache: Dict[Path, Tuple[int, int, Dict[str, object]]] = {}
 
 		self.csv_path_var = tk.StringVar()
 		self.output_dir_var = tk.StringVar(value=str(Path.cwd() / "output"))
 		self.cache_dir_var = tk.StringVar(value=str(Path.cwd() / "cache"))
+		self.revalidate_var = tk.BooleanVar(value=self.downloader.revalidate)
+		self.output_format_var = tk.StringVar(value=self.generator.output_format)
+		self.small_output_var = tk.BooleanVar(value=False)
 		self.status_var = tk.StringVar(value="Idle")
 
 		self._build_ui()
@@ -1045,6 +1525,10 @@ class SnapshotApp(tk.Tk):
 		self.pause_button.pack(side="left", padx=(8, 0))
 		self.stop_button = ttk.Button(action_frame, text="Stop", state="disabled", command=self._stop_generation)
 		self.stop_button.pack(side="left", padx=(8, 0))
+		ttk.Label(action_frame, text="Format").pack(side="left", padx=(12, 4))
+		formats = list(PostGenerationService.OUTPUT_FORMATS)
+		ttk.OptionMenu(action_frame, self.output_format_var, self.output_format_var.get(), *formats).pack(side="left")
+		ttk.Checkbutton(action_frame, text="Smaller files (slower save)", variable=self.small_output_var).pack(side="left", padx=(12, 0))
 		ttk.Label(action_frame, textvariable=self.status_var).pack(side="left", padx=12)
 
 		log_frame = ttk.LabelFrame(container, text="Activity Log")
@@ -1100,6 +1584,7 @@ class SnapshotApp(tk.Tk):
 		ttk.Label(frame, text="Download Cache").grid(row=2, column=0, sticky="w", pady=4)
 		ttk.Entry(frame, textvariable=self.cache_dir_var, width=80).grid(row=2, column=1, sticky="we", padx=6)
 		ttk.Button(frame, text="Browse", command=lambda: self._choose_directory(self.cache_dir_var)).grid(row=2, column=2)
+		ttk.Checkbutton(frame, text="Re-check cached photos with the server", variable=self.revalidate_var).grid(row=3, column=1, sticky="w", padx=6)
 
 		frame.columnconfigure(1, weight=1)
 
@@ -1139,7 +1624,7 @@ class SnapshotApp(tk.Tk):
 		def apply_callback(new_layout: TemplateLayout) -> None:
 			self.template_manager.set_layout(new_layout)
 			self._update_template_status()
-			messagebox.showinfo("Applied", f"{orientation.value.title()} template updated")
+			self._flash_status(f"{orientation.value.title()} template updated")
 
 		TemplateEditor(self, orientation, layout, apply_callback)
 
@@ -1147,15 +1632,25 @@ class SnapshotApp(tk.Tk):
 		path = filedialog.askopenfilename(title="Load Template Config", filetypes=[("Template Config", "*.json"), ("All Files", "*.*")])
 		if not path:
 			return
-		with open(path, "r", encoding="utf-8") as handle:
-			data = json.load(handle)
-		layout = TemplateLayout.from_dict(data)
+		config_path = Path(path)
+		layout = self._read_layout(config_path)
 		if layout.orientation != orientation:
 			messagebox.showerror("Orientation mismatch", "Selected configuration is for a different orientation.")
 			return
-		self.template_manager.set_layout(layout, source=Path(path))
+		self.template_manager.set_layout(layout, source=config_path)
 		self._update_template_status()
-		messagebox.showinfo("Loaded", f"{orientation.value.title()} template loaded from {path}")
+		self._flash_status(f"{orientation.value.title()} template loaded from {path}")
+
+	def _read_layout(self, path: Path) -> TemplateLayout:
+		stat = path.stat()
+		cached = self._layout_cache.get(path)
+		if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+			data = cached[2]
+		else:
+			data = _load_json(path)
+			self._layout_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+		# The editor mutates layouts in place, so each caller gets a fresh instance.
+		return TemplateLayout.from_dict(data)
 
 	def _update_template_status(self) -> None:
 		try:
@@ -1173,10 +1668,11 @@ class SnapshotApp(tk.Tk):
 		if self._generation_thread and self._generation_thread.is_alive():
 			messagebox.showinfo("In Progress", "Generation is already running.")
 			return
-		csv_path = self.csv_path_var.get()
-		if not csv_path:
+		csv_value = self.csv_path_var.get()
+		if not csv_value:
 			messagebox.showerror("Missing CSV", "Select the responses CSV file first.")
 			return
+		csv_path = Path(csv_value)
 		try:
 			self.template_manager.get_layout(Orientation.LANDSCAPE)
 			self.template_manager.get_layout(Orientation.PORTRAIT)
@@ -1186,6 +1682,9 @@ class SnapshotApp(tk.Tk):
 
 		output_dir = Path(self.output_dir_var.get())
 		cache_dir = Path(self.cache_dir_var.get())
+		self.downloader.revalidate = self.revalidate_var.get()
+		self.generator.output_format = self.output_format_var.get()
+		self.generator.save_profile = "small" if self.small_output_var.get() else "fast"
 		self._controller = GenerationController()
 		self.status_var.set("Preparing...")
 		self.log_handler.write("Starting generation...")
@@ -1193,12 +1692,13 @@ class SnapshotApp(tk.Tk):
 
 		def worker() -> None:
 			try:
-				photos = self.repository.read_submissions(Path(csv_path))
+				photos = self.repository.iter_submissions(csv_path)
+				first = next(photos, None)
 			except Exception as err:
 				self._on_generation_finished(f"Failed to parse CSV: {err}")
 				return
 
-			if not photos:
+			if first is None:
 				self._on_generation_finished("No photos found in CSV")
 				return
 
@@ -1214,7 +1714,7 @@ class SnapshotApp(tk.Tk):
 			controller = self._controller
 			try:
 				results = self.generator.generate(
-					photos,
+					itertools.chain((first,), photos),
 					output_dir,
 					cache_dir,
 					progress_callback=progress,
@@ -1232,6 +1732,16 @@ class SnapshotApp(tk.Tk):
 		self._generation_thread = threading.Thread(target=worker, daemon=True)
 		self._generation_thread.start()
 
+	def _flash_status(self, message: str, duration_ms: int = 3000) -> None:
+		previous = self.status_var.get()
+		self.status_var.set(message)
+
+		def restore() -> None:
+			if self.status_var.get() == message:
+				self.status_var.set(previous)
+
+		self.after(duration_ms, restore)
+
 	def _on_generation_finished(self, message: str) -> None:
 		def update() -> None:
 			self.status_var.set(message)
@@ -1245,8 +1755,14 @@ class SnapshotApp(tk.Tk):
 
 def main() -> None:
 	app = SnapshotApp()
-	app.mainloop()
+	try:
+		app.mainloop()
+	finally:
+		if app._controller:
+			app._controller.request_stop()
+		app.generator.shutdown()
 
 
 if __name__ == "__main__":
+	multiprocessing.freeze_support()
 	main()